@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -81,6 +82,48 @@ DATABASES = {
     }
 }
 
+# PostgreSQL in production (set POSTGRES_DB to enable). server_side_binding
+# plus prepare_threshold=1 make psycopg 3 PREPARE the hot search statement on
+# first use and reuse the cached plan on every later execution, and
+# CONN_MAX_AGE keeps connections - and their plan caches - alive across
+# requests instead of reconnecting per request.
+if os.environ.get('POSTGRES_DB'):
+    DATABASES['default'] = {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.environ['POSTGRES_DB'],
+        'USER': os.environ.get('POSTGRES_USER', 'postgres'),
+        'PASSWORD': os.environ.get('POSTGRES_PASSWORD', ''),
+        'HOST': os.environ.get('POSTGRES_HOST', 'localhost'),
+        'PORT': os.environ.get('POSTGRES_PORT', '5432'),
+        'CONN_MAX_AGE': 60,
+        'OPTIONS': {
+            'server_side_binding': True,
+            'prepare_threshold': 1,
+        },
+    }
+
+
+# Cache
+# Search responses are cached briefly (see products/views.py). Point
+# REDIS_URL at a Redis instance in production; the local-memory backend
+# keeps development and tests dependency-free.
+
+REDIS_URL = os.environ.get('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-09-01 02:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0004_alter_product_category_alter_product_created_at_and_more'),
+    ]
+
+    operations = [
+        migrations.RenameIndex(
+            model_name='product',
+            new_name='idx_product_category_sort',
+            old_name='idx_product_search_optimized',
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['is_active', 'category', 'price', '-created_at'], include=('id', 'sku', 'name'), name='idx_product_full_search_cov'),
+        ),
+    ]
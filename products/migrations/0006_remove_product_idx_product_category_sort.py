@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-09-01 02:43
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0005_rename_idx_product_search_optimized_idx_product_category_sort_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='product',
+            name='idx_product_category_sort',
+        ),
+    ]
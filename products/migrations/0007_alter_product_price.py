@@ -0,0 +1,43 @@
+# Generated by Django 4.2.7 on 2026-09-01 02:44
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def dollars_to_cents(apps, schema_editor):
+    """Scale prices to cents while the column is wide enough to hold them"""
+    Product = apps.get_model('products', 'Product')
+    Product.objects.update(price=F('price') * 100)
+
+
+def cents_to_dollars(apps, schema_editor):
+    Product = apps.get_model('products', 'Product')
+    Product.objects.update(price=F('price') / 100)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0006_remove_product_idx_product_category_sort'),
+    ]
+
+    operations = [
+        # Widen before multiplying: NUMERIC(10,2) legally holds up to
+        # $99,999,999.99, and scaling that by 100 overflows the old
+        # precision. NUMERIC(12,2) fits every legal value times 100.
+        migrations.AlterField(
+            model_name='product',
+            name='price',
+            field=models.DecimalField(
+                max_digits=12,
+                decimal_places=2,
+                help_text='Product price in USD',
+            ),
+        ),
+        migrations.RunPython(dollars_to_cents, cents_to_dollars),
+        migrations.AlterField(
+            model_name='product',
+            name='price',
+            field=models.BigIntegerField(help_text='Product price in USD cents'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-09-01 02:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0007_alter_product_price'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='product',
+            name='idx_product_full_search_cov',
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['is_active', 'category', 'price', '-created_at', '-id'], include=('sku', 'name'), name='idx_product_full_search_cov'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2026-09-01 02:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0008_remove_product_idx_product_full_search_cov_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='product',
+            name='idx_product_price_range',
+        ),
+        migrations.RemoveIndex(
+            model_name='product',
+            name='idx_product_full_search_cov',
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['category', 'price', '-created_at', '-id'], include=('sku', 'name'), name='idx_product_full_search_cov'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['price'], name='idx_product_price_range'),
+        ),
+    ]
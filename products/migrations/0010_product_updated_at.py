@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-09-01 02:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0009_remove_product_idx_product_price_range_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, help_text='When product was last modified (drives detail ETags)'),
+        ),
+    ]
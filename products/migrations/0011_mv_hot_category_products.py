@@ -0,0 +1,54 @@
+from django.db import migrations
+
+# Pre-filtered, pre-sorted listings for the busiest categories (by active
+# product count). The unique index both serves (category_id, created_at, id)
+# keyset scans and allows REFRESH MATERIALIZED VIEW CONCURRENTLY - schedule
+# products.services.refresh_hot_category_products() from cron to keep it
+# current. PostgreSQL only; other backends skip the view entirely.
+
+CREATE_VIEW_SQL = """
+CREATE MATERIALIZED VIEW mv_hot_category_products AS
+SELECT p.id, p.sku, p.name, p.price, p.is_active, p.category_id,
+       c.name AS cat_name, p.created_at
+FROM products_product p
+JOIN products_category c ON c.id = p.category_id
+WHERE p.is_active AND p.category_id IN (
+    SELECT category_id FROM products_product
+    WHERE is_active
+    GROUP BY category_id
+    ORDER BY count(*) DESC
+    LIMIT 10
+)
+ORDER BY p.category_id, p.created_at DESC, p.id DESC
+"""
+
+CREATE_INDEX_SQL = """
+CREATE UNIQUE INDEX mv_hot_cat_prod_uq
+ON mv_hot_category_products (category_id, created_at DESC, id DESC)
+"""
+
+DROP_VIEW_SQL = "DROP MATERIALIZED VIEW IF EXISTS mv_hot_category_products"
+
+
+def create_view(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(CREATE_VIEW_SQL)
+    schema_editor.execute(CREATE_INDEX_SQL)
+
+
+def drop_view(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(DROP_VIEW_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0010_product_updated_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_view, drop_view),
+    ]
@@ -0,0 +1,37 @@
+from django.db import migrations
+
+# BRIN summarizes created_at per block range instead of indexing every row,
+# so on an append-mostly table it stays kilobytes where a B-tree would grow
+# to gigabytes, with near-free maintenance on INSERT. The planner can
+# bitmap-AND it with the B-tree indexes for coarse time-window elimination.
+# Django's Index class doesn't expose BRIN, hence raw SQL; PostgreSQL only.
+
+CREATE_SQL = (
+    "CREATE INDEX brin_created_at ON products_product "
+    "USING BRIN (created_at) WITH (pages_per_range = 32)"
+)
+
+DROP_SQL = "DROP INDEX IF EXISTS brin_created_at"
+
+
+def create_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(CREATE_SQL)
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(DROP_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0011_mv_hot_category_products'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
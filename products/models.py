@@ -1,3 +1,5 @@
+import decimal
+
 from django.db import models
 from django.utils import timezone
 
@@ -34,24 +36,43 @@ class ProductQuerySet(models.QuerySet):
         """Filter products within price range"""
         return self.filter(price__range=(min_price, max_price))
     
-    def search_products(self, category_id=None, min_price=None, max_price=None):
+    def search_products(self, **filters):
         """
         Main search method that combines common filters
         Used for category browsing and product discovery
+
+        Callers pass only the filters they actually have: 'category_id'
+        and/or 'price_range' as a (min_cents, max_cents) tuple where either
+        bound may be None for an open-ended range. Keeping absent filters
+        out of the dict makes the no-filter fast path branch-free
+
+        All conditions are folded into a single .filter() call - every
+        chained filter clones the QuerySet (deep-copying .query), so the
+        standalone methods above stay as public API while the hot path
+        pays for one clone instead of three
         """
-        # Start with active products only
-        queryset = self.active_products()
-        
-        # Apply category filter if provided
-        if category_id:
-            queryset = queryset.by_category(category_id)
-        
-        # Apply price range if both min and max are provided
-        if min_price is not None and max_price is not None:
-            queryset = queryset.by_price_range(min_price, max_price)
-        
-        # Optimize query by including category data and applying default ordering
-        return queryset.select_related('category').order_by('-created_at')
+        kw = {'is_active': True}
+
+        if 'category_id' in filters:
+            kw['category_id'] = filters['category_id']
+
+        # Either price bound may be open
+        if 'price_range' in filters:
+            min_price, max_price = filters['price_range']
+            if min_price is not None and max_price is not None:
+                kw['price__range'] = (min_price, max_price)
+            elif min_price is not None:
+                kw['price__gte'] = min_price
+            else:
+                kw['price__lte'] = max_price
+
+        # Pull the category name as one scalar column instead of
+        # select_related, which would widen every row with the full
+        # Category record. Callers read product.cat_name and the local
+        # product.category_id - no extra queries, far fewer bytes per row
+        return self.filter(**kw).annotate(
+            cat_name=models.F('category__name')
+        ).order_by('-created_at')
 
 
 class ProductManager(models.Manager):
@@ -62,7 +83,13 @@ class ProductManager(models.Manager):
     
     def active_products(self):
         return self.get_queryset().active_products()
-    
+
+    def by_category(self, category_id):
+        return self.get_queryset().by_category(category_id)
+
+    def by_price_range(self, min_price, max_price):
+        return self.get_queryset().by_price_range(min_price, max_price)
+
     def search_products(self, **filters):
         return self.get_queryset().search_products(**filters)
 
@@ -85,10 +112,8 @@ class Product(models.Model):
         max_length=200,
         help_text="Product display name"
     )
-    price = models.DecimalField(
-        max_digits=10,
-        decimal_places=2,
-        help_text="Product price in USD"
+    price = models.BigIntegerField(
+        help_text="Product price in USD cents"
     )
     is_active = models.BooleanField(
         default=True,
@@ -104,6 +129,10 @@ class Product(models.Model):
         default=timezone.now,
         help_text="When product was added to catalog"
     )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="When product was last modified (drives detail ETags)"
+    )
     description = models.TextField(blank=True)
     
     objects = ProductManager()
@@ -114,34 +143,47 @@ class Product(models.Model):
         # =========================================================================
         # INDEXING STRATEGY - Optimized for different search scenarios:
         #
-        # PRIMARY INDEXES:
-        # - [is_active, category, -created_at] for category browsing (no price filter)
-        # - [is_active, category, price, -created_at] for filtered searches (with price)
-        # - Database query planner chooses the best one automatically
+        # PRIMARY INDEX: [category, price, -created_at, -id] WHERE is_active
+        # - Serves filtered searches (with price) directly
+        # - Its [category] prefix also covers plain category browsing,
+        #   so no separate 3-column index is needed
         #
-        # SECONDARY INDEX: [is_active, price]  
+        # SECONDARY INDEX: [price] WHERE is_active
         # - For price-only searches across all categories
         # - Handles "deals under $X" type queries
         #
+        # Both are partial (WHERE is_active = TRUE): every search starts
+        # from active_products(), so inactive rows would only bloat the
+        # B-trees and pay write amplification without ever being read
+        #
         # UTILITY INDEXES: sku and name for direct lookups
         # =========================================================================
         
         indexes = [
-            # Primary index for category browsing (no price filter)
+            # Primary index for filtered searches (category + price)
+            # Also serves category browsing without a price filter: the
+            # (is_active, category) prefix matches and the planner scans
+            # through the price column to reach the -created_at ordering,
+            # so a separate 3-column index would only add write
+            # amplification and buffer-cache footprint
+            # INCLUDE carries the returned columns in the leaf pages so
+            # PostgreSQL can answer list queries with an index-only scan
+            # (no heap fetches). description stays out - TEXT would bloat
+            # the index. Backends without covering indexes (e.g. SQLite)
+            # build it as a plain index on the key columns.
+            # id trails -created_at as an explicit keyset-pagination
+            # tie-breaker, so (created_at, id) cursor seeks stay in-index
             models.Index(
-                fields=['is_active', 'category', '-created_at'],
-                name='idx_product_category_sort'
+                fields=['category', 'price', '-created_at', '-id'],
+                include=['sku', 'name'],
+                condition=models.Q(is_active=True),
+                name='idx_product_full_search_cov'
             ),
-            
-            # Enhanced index for filtered searches (category + price)
-            models.Index(
-                fields=['is_active', 'category', 'price', '-created_at'],
-                name='idx_product_full_search'
-            ),
-            
+
             # Secondary index for price-only searches
             models.Index(
-                fields=['is_active', 'price'],
+                fields=['price'],
+                condition=models.Q(is_active=True),
                 name='idx_product_price_range'
             ),
             
@@ -150,5 +192,10 @@ class Product(models.Model):
             models.Index(fields=['name'], name='idx_product_name'),
         ]
     
+    @property
+    def price_decimal(self):
+        """Price in dollars as a Decimal, for display and legacy callers"""
+        return decimal.Decimal(self.price).scaleb(-2)
+
     def __str__(self):
         return f"{self.name} ({self.sku})"
\ No newline at end of file
@@ -1,6 +1,28 @@
-from django.db import models
+from django.core.cache import cache
+from django.db import connection
+
 from .models import Product
 
+# Cached set of category ids captured by the materialized view; the search
+# fast path consults it to decide which categories the view can serve
+HOT_CATEGORIES_CACHE_KEY = 'psearch:hotcats'
+
+
+def refresh_hot_category_products():
+    """
+    Refresh the hot-category materialized view (PostgreSQL only)
+    Run periodically (e.g. nightly via cron) so the pre-sorted listings
+    served from mv_hot_category_products stay current
+    """
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'REFRESH MATERIALIZED VIEW CONCURRENTLY mv_hot_category_products'
+        )
+    # The refresh may have changed which categories the view captures
+    cache.delete(HOT_CATEGORIES_CACHE_KEY)
+
 
 class ProductSearchService:
     """
@@ -14,8 +36,9 @@ class ProductSearchService:
         Main search entry point - applies filters and returns optimized queryset
         
         Args:
-            filters: dict with category_id, min_price, max_price
-            
+            filters: dict with only the filters to apply - 'category_id'
+                and/or 'price_range' as a (min_cents, max_cents) tuple
+
         Returns:
             QuerySet of products with category data pre-loaded
         """
@@ -24,13 +47,20 @@ class ProductSearchService:
     @staticmethod
     def get_product_detail(product_id):
         """
-        Get single product with all related data loaded
-        Prevents N+1 queries when accessing category information
-        
+        Get single product as a plain dict with category columns included
+        .values() hands the row straight from the cursor - no Product or
+        Category instance construction for a response that uses a handful
+        of fields
+
         Args:
             product_id: ID of product to retrieve
-            
+
         Returns:
-            Product instance with category data
+            dict of product fields plus category__id / category__name,
+            or None when no such product exists - a plain return is far
+            cheaper than raising and catching DoesNotExist
         """
-        return Product.objects.select_related('category').get(id=product_id)
\ No newline at end of file
+        return Product.objects.filter(id=product_id).values(
+            'id', 'sku', 'name', 'price', 'is_active', 'description',
+            'created_at', 'category__id', 'category__name',
+        ).first()
\ No newline at end of file
@@ -0,0 +1,21 @@
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Product
+
+# Version prefix for search-result cache keys. Bumping it on any product
+# change invalidates every cached search page at once, without having to
+# enumerate the filter combinations that might be cached.
+SEARCH_CACHE_VER_KEY = 'psearch:ver'
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def invalidate_search_cache(sender, **kwargs):
+    """Bump the search-cache version whenever a product changes"""
+    try:
+        cache.incr(SEARCH_CACHE_VER_KEY)
+    except ValueError:
+        # Key missing (never set or expired) - seed it past the default
+        cache.set(SEARCH_CACHE_VER_KEY, 2, None)
@@ -1,7 +1,10 @@
+import json
+
 from django.test import TestCase
 from django.utils import timezone
 from decimal import Decimal
 
+from . import views
 from .models import Product, Category
 from .services import ProductSearchService
 
@@ -26,7 +29,7 @@ class ProductModelTest(TestCase):
         self.phone = Product.objects.create(
             sku="PHONE001",
             name="Smartphone",
-            price=Decimal('599.99'),
+            price=59999,
             is_active=True,
             category=self.electronics
         )
@@ -34,7 +37,7 @@ class ProductModelTest(TestCase):
         self.laptop = Product.objects.create(
             sku="LAPTOP001", 
             name="Gaming Laptop",
-            price=Decimal('1299.99'),
+            price=129999,
             is_active=True, 
             category=self.electronics
         )
@@ -42,7 +45,7 @@ class ProductModelTest(TestCase):
         self.shirt = Product.objects.create(
             sku="SHIRT001",
             name="Cotton T-Shirt", 
-            price=Decimal('24.99'),
+            price=2499,
             is_active=True,
             category=self.clothing
         )
@@ -51,7 +54,7 @@ class ProductModelTest(TestCase):
         self.old_tablet = Product.objects.create(
             sku="TABLET001",
             name="Old Tablet",
-            price=Decimal('199.99'),
+            price=19999,
             is_active=False,
             category=self.electronics
         )
@@ -60,7 +63,8 @@ class ProductModelTest(TestCase):
         """Test that products are created correctly"""
         self.assertEqual(self.phone.name, "Smartphone")
         self.assertEqual(self.phone.sku, "PHONE001")
-        self.assertEqual(self.phone.price, Decimal('599.99'))
+        self.assertEqual(self.phone.price, 59999)  # stored as cents
+        self.assertEqual(self.phone.price_decimal, Decimal('599.99'))
         self.assertTrue(self.phone.is_active)
     
     def test_active_products_filter(self):
@@ -82,11 +86,11 @@ class ProductModelTest(TestCase):
     def test_price_range_filter(self):
         """Test filtering by price range"""
         # Mid-range products
-        mid_priced = Product.objects.by_price_range(Decimal('500'), Decimal('700'))
+        mid_priced = Product.objects.by_price_range(50000, 70000)
         self.assertEqual(mid_priced.count(), 1)  # Just the phone
         
         # Budget products  
-        budget_priced = Product.objects.by_price_range(Decimal('20'), Decimal('30'))
+        budget_priced = Product.objects.by_price_range(2000, 3000)
         self.assertEqual(budget_priced.count(), 1)  # Just the shirt
     
     def test_complex_search(self):
@@ -94,8 +98,7 @@ class ProductModelTest(TestCase):
         # Search for electronics between $500-$1500
         results = Product.objects.search_products(
             category_id=self.electronics.id,
-            min_price=Decimal('500.00'),
-            max_price=Decimal('1500.00')
+            price_range=(50000, 150000)
         )
         
         self.assertEqual(results.count(), 2)  # Phone and laptop
@@ -117,8 +120,15 @@ class ProductModelTest(TestCase):
             ))
             # Access category data - should not trigger new queries
             for product in products:
-                _ = product.category.name
-                _ = product.category.description
+                _ = product.cat_name
+                _ = product.category_id
+
+    def test_search_annotates_category_name(self):
+        """Test that search results carry the category name annotation"""
+        product = Product.objects.search_products(
+            category_id=self.electronics.id
+        ).first()
+        self.assertEqual(product.cat_name, "Electronics")
     
     def test_default_ordering(self):
         """Test that products are ordered by newest first"""
@@ -126,7 +136,7 @@ class ProductModelTest(TestCase):
         new_product = Product.objects.create(
             sku="NEW001",
             name="Newest Product", 
-            price=Decimal('99.99'),
+            price=9999,
             is_active=True,
             category=self.electronics
         )
@@ -141,25 +151,34 @@ class ProductModelTest(TestCase):
         
         # Verify all expected indexes exist
         expected_indexes = [
-            'idx_product_search_optimized',  # Your primary index
+            'idx_product_full_search_cov',   # Covering search index
             'idx_product_price_range',       # Price range index
             'idx_product_sku',               # SKU index
             'idx_product_name',              # Name index
         ]
-        
+
         for expected_index in expected_indexes:
-            self.assertIn(expected_index, index_names, 
+            self.assertIn(expected_index, index_names,
                          f"Index {expected_index} should be defined")
-        
-        # Verify the primary index has correct field structure
+
+        # Verify the covering search index has correct field structure
         search_index = next(
-            idx for idx in indexes 
-            if idx.name == 'idx_product_search_optimized'
+            idx for idx in indexes
+            if idx.name == 'idx_product_full_search_cov'
         )
         self.assertEqual(
-            search_index.fields, 
-            ['is_active', 'category', '-created_at'],
-            "Primary search index should have correct field order"
+            search_index.fields,
+            ['category', 'price', '-created_at', '-id'],
+            "Covering search index should have correct field order"
+        )
+        self.assertIsNotNone(
+            search_index.condition,
+            "Covering search index should be partial on is_active"
+        )
+        self.assertEqual(
+            search_index.include,
+            ('sku', 'name'),
+            "Covering search index should carry list columns in its leaves"
         )
 
 
@@ -195,7 +214,7 @@ class ProductSearchServiceTest(TestCase):
         self.product = Product.objects.create(
             sku="TEST001",
             name="Test Product",
-            price=Decimal('75.00'),
+            price=7500,
             is_active=True,
             category=self.category
         )
@@ -204,8 +223,7 @@ class ProductSearchServiceTest(TestCase):
         """Test service layer with basic filters"""
         results = ProductSearchService.search_products({
             'category_id': self.category.id,
-            'min_price': Decimal('50.00'),
-            'max_price': Decimal('100.00')
+            'price_range': (5000, 10000)
         })
         
         self.assertEqual(results.count(), 1)
@@ -214,19 +232,26 @@ class ProductSearchServiceTest(TestCase):
     def test_get_product_detail(self):
         """Test retrieving single product with category data"""
         product = ProductSearchService.get_product_detail(self.product.id)
-        self.assertEqual(product.name, "Test Product")
-        self.assertEqual(product.category.name, "Test Category")
+        self.assertEqual(product['name'], "Test Product")
+        self.assertEqual(product['category__name'], "Test Category")
+
+
+def _json_body(response):
+    """Decode a JSON body from a plain or streaming response"""
+    if response.streaming:
+        return json.loads(b''.join(response.streaming_content))
+    return response.json()
 
 
 class ProductSearchViewTest(TestCase):
     """Test API view endpoints"""
-    
+
     def setUp(self):
         self.category = Category.objects.create(name="Test Category")
         self.product = Product.objects.create(
             sku="VIEWTEST001",
             name="View Test Product", 
-            price=Decimal('100.00'),
+            price=10000,
             is_active=True,
             category=self.category
         )
@@ -240,11 +265,79 @@ class ProductSearchViewTest(TestCase):
         })
         
         self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = _json_body(response)
         self.assertTrue(data['success'])
         self.assertEqual(data['count'], 1)
         self.assertEqual(data['products'][0]['name'], 'View Test Product')
     
+    def test_search_view_cursor_pagination(self):
+        """Test keyset pagination walks the result set without overlap"""
+        for i in range(3):
+            Product.objects.create(
+                sku=f"PAGE{i:03d}",
+                name=f"Paged Product {i}",
+                price=1000 + i,
+                is_active=True,
+                category=self.category
+            )
+
+        original_page_size = views.SEARCH_PAGE_SIZE
+        views.SEARCH_PAGE_SIZE = 2
+        try:
+            first_page = _json_body(self.client.get('/api/products/search/'))
+            self.assertEqual(first_page['count'], 2)
+            self.assertIsNotNone(first_page['next_cursor'])
+
+            second_page = _json_body(self.client.get('/api/products/search/', {
+                'cursor': first_page['next_cursor']
+            }))
+            self.assertTrue(second_page['success'])
+
+            first_ids = {p['id'] for p in first_page['products']}
+            second_ids = {p['id'] for p in second_page['products']}
+            self.assertFalse(first_ids & second_ids)  # No overlap
+            self.assertEqual(len(first_ids | second_ids), 4)  # All products
+        finally:
+            views.SEARCH_PAGE_SIZE = original_page_size
+
+    def test_search_view_invalid_cursor(self):
+        """Test that a malformed cursor is rejected with a 400"""
+        response = self.client.get('/api/products/search/', {
+            'cursor': 'not-a-cursor'
+        })
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.json()['success'])
+
+    def test_search_view_min_price_only(self):
+        """Test that an open-ended minimum price filter is applied"""
+        response = self.client.get('/api/products/search/', {
+            'min_price': '150'
+        })
+
+        self.assertEqual(response.status_code, 200)
+        data = _json_body(response)
+        self.assertTrue(data['success'])
+        self.assertEqual(data['count'], 0)  # Only product costs $100
+
+    def test_search_view_non_decimal_category_id(self):
+        """Test that exotic digit characters get the proper error message"""
+        response = self.client.get('/api/products/search/', {
+            'category_id': '²'  # superscript two passes isdigit()
+        })
+
+        self.assertEqual(response.status_code, 400)
+        data = response.json()
+        self.assertIn('category_id must be a valid number', data['error'])
+
+    def test_search_view_overlong_price(self):
+        """Test that an absurdly long price is rejected, not crashed on"""
+        response = self.client.get('/api/products/search/', {
+            'min_price': '9' * 400
+        })
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.json()['success'])
+
     def test_search_view_invalid_price(self):
         """Test search with invalid price parameter"""
         response = self.client.get('/api/products/search/', {
@@ -265,6 +358,19 @@ class ProductSearchViewTest(TestCase):
         self.assertTrue(data['success'])
         self.assertEqual(data['product']['sku'], 'VIEWTEST001')
     
+    def test_product_detail_etag(self):
+        """Test that detail responses carry an ETag and honor If-None-Match"""
+        response = self.client.get(f'/api/products/{self.product.id}/')
+        etag = response.headers['ETag']
+        self.assertTrue(etag)
+
+        # Replaying the ETag should short-circuit to a body-less 304
+        response = self.client.get(
+            f'/api/products/{self.product.id}/',
+            HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 304)
+
     def test_product_detail_not_found(self):
         """Test product detail with invalid ID"""
         response = self.client.get('/api/products/9999/')
@@ -1,12 +1,224 @@
-from django.http import JsonResponse
+from django.core.cache import cache
+from django.http import (
+    HttpResponse,
+    HttpResponseNotModified,
+    StreamingHttpResponse,
+)
 from django.views import View
-from django.core.exceptions import ObjectDoesNotExist
-from django.db import DatabaseError
+from django.db import DatabaseError, connection
+from django.db.models import Q
+import base64
 import decimal
+import re
+from datetime import datetime
+from itertools import chain
 
-from .services import ProductSearchService
+import orjson
+
+from .services import ProductSearchService, HOT_CATEGORIES_CACHE_KEY
+from .signals import SEARCH_CACHE_VER_KEY
 from .models import Product
 
+# How long cached search responses stay valid. Short on purpose - the
+# version bump in signals.py handles correctness, the TTL just bounds
+# memory usage for rarely-repeated filter combinations.
+SEARCH_CACHE_TTL = 60
+
+# Maximum products per search response page
+SEARCH_PAGE_SIZE = 100
+
+# How long the set of categories captured by the materialized view is
+# cached before being re-read from the view itself
+HOT_CATEGORIES_TTL = 300
+
+
+def _decode_cursor(cursor_str):
+    """
+    Decode an opaque pagination cursor into (created_at, id)
+    Keyset pagination seeks directly to this position in the index instead
+    of walking past OFFSET rows, so deep pages stay as cheap as page one
+    """
+    try:
+        created_at_iso, last_id = orjson.loads(
+            base64.urlsafe_b64decode(cursor_str)
+        )
+        return datetime.fromisoformat(created_at_iso), int(last_id)
+    except (ValueError, TypeError, orjson.JSONDecodeError):
+        raise ValueError('cursor is not a valid pagination cursor')
+
+
+def _encode_cursor(created_at, last_id):
+    """Encode the position after the last returned row as an opaque cursor"""
+    blob = orjson.dumps([created_at, last_id], default=str)
+    return base64.urlsafe_b64encode(blob).decode()
+
+
+# Shape of a valid dollar amount: up to ten digits (the old NUMERIC(10,2)
+# contract - an unbounded run would overflow float/bigint downstream),
+# optionally a dot and up to two decimals. Compiled once so request parsing
+# is a match call, not a parse attempt that raises on bad input. The bound
+# method is hoisted to a module-level name so the hot path resolves it
+# without attribute lookups
+_PRICE_RE = re.compile(r'^\d{1,10}(\.\d{1,2})?$')
+_match_price = _PRICE_RE.match
+
+
+def _parse_price(value, name):
+    """Parse one dollar-amount query parameter to cents, None if absent"""
+    if not value:
+        return None
+    if not _match_price(value):
+        raise ValueError(f'{name} must be a valid dollar amount')
+    # Integer arithmetic - exact, and no float overflow to guard against
+    dollars, _, cents = value.partition('.')
+    return int(dollars) * 100 + int(cents.ljust(2, '0'))
+
+
+def _price_str(cents):
+    """Format integer cents as a dollar string for API payloads"""
+    return str(decimal.Decimal(cents).scaleb(-2))
+
+
+def _filters_echo(filters):
+    """Echo applied filters back in dollars, the unit the client sent"""
+    echo = dict(filters)
+    price_range = echo.get('price_range')
+    if price_range:
+        echo['price_range'] = [
+            _price_str(bound) if bound is not None else None
+            for bound in price_range
+        ]
+    return echo
+
+
+def _hot_category_ids():
+    """
+    Category ids currently captured by mv_hot_category_products
+    Read (briefly cached) from the view itself rather than a hand-kept
+    setting, so the fast path can never serve an empty page for a category
+    the view does not actually contain. PostgreSQL only
+    """
+    hot_ids = cache.get(HOT_CATEGORIES_CACHE_KEY)
+    if hot_ids is None:
+        with connection.cursor() as cur:
+            cur.execute(
+                'SELECT DISTINCT category_id FROM mv_hot_category_products'
+            )
+            hot_ids = frozenset(row[0] for row in cur.fetchall())
+        cache.set(HOT_CATEGORIES_CACHE_KEY, hot_ids, HOT_CATEGORIES_TTL)
+    return hot_ids
+
+
+def _postgres_search_response(filters, cursor=None):
+    """
+    Build the entire search response body inside PostgreSQL
+
+    json_agg/json_build_object assemble the products array as a single
+    scalar in C, so per-row marshaling through the ORM and Python dict
+    construction is skipped entirely. Only used on PostgreSQL; other
+    backends fall back to the ORM path in ProductSearchView.get
+    """
+    where = ['p.is_active']
+    params = []
+
+    category_id = filters.get('category_id')
+    if category_id:
+        where.append('p.category_id = %s')
+        params.append(category_id)
+
+    price_range = filters.get('price_range')
+    if price_range:
+        min_price, max_price = price_range
+        if min_price is not None and max_price is not None:
+            where.append('p.price BETWEEN %s AND %s')
+            params.extend([min_price, max_price])
+        elif min_price is not None:
+            where.append('p.price >= %s')
+            params.append(min_price)
+        else:
+            where.append('p.price <= %s')
+            params.append(max_price)
+
+    # Keyset pagination via row comparison - seeks straight into the index
+    if cursor is not None:
+        where.append('(p.created_at, p.id) < (%s, %s)')
+        params.extend(cursor)
+
+    # Hot categories' default listings come from the materialized view -
+    # a pre-filtered, pre-sorted tuple stream with the category name baked
+    # in, refreshed out-of-band (services.refresh_hot_category_products)
+    if (category_id and not price_range
+            and category_id in _hot_category_ids()):
+        select_from = (
+            "SELECT p.id, p.sku, p.name, p.price, p.is_active, p.created_at, "
+            "p.category_id AS cat_id, p.cat_name "
+            "FROM mv_hot_category_products p "
+        )
+    else:
+        select_from = (
+            "SELECT p.id, p.sku, p.name, p.price, p.is_active, p.created_at, "
+            "c.id AS cat_id, c.name AS cat_name "
+            "FROM products_product p "
+            "JOIN products_category c ON c.id = p.category_id "
+        )
+
+    sql = (
+        "SELECT coalesce(json_agg(json_build_object("
+        "'id', sub.id, 'sku', sub.sku, 'name', sub.name, "
+        "'price', to_char(sub.price / 100.0, 'FM999999999990.00'), "
+        "'is_active', sub.is_active, "
+        "'category', json_build_object('id', sub.cat_id, 'name', sub.cat_name), "
+        "'created_at', sub.created_at"
+        ") ORDER BY sub.created_at DESC, sub.id DESC)::text, '[]'), "
+        "count(*), "
+        "(array_agg(sub.created_at ORDER BY sub.created_at, sub.id))[1], "
+        "(array_agg(sub.id ORDER BY sub.created_at, sub.id))[1] "
+        "FROM ("
+        + select_from +
+        "WHERE " + " AND ".join(where) +
+        " ORDER BY p.created_at DESC, p.id DESC LIMIT %s"
+        ") sub"
+    )
+    params.append(SEARCH_PAGE_SIZE)
+
+    with connection.cursor() as cur:
+        cur.execute(sql, params)
+        products_json, count, last_created_at, last_id = cur.fetchone()
+
+    next_cursor = None
+    if count == SEARCH_PAGE_SIZE:
+        next_cursor = _encode_cursor(last_created_at, last_id)
+
+    # Splice the DB-built products array into the response envelope
+    tail = orjson.dumps(
+        {
+            'count': count,
+            'next_cursor': next_cursor,
+            'filters_applied': _filters_echo(filters),
+        },
+        default=str
+    )
+    return b'{"success":true,"products":' + products_json.encode() + b',' + tail[1:]
+
+
+def _search_cache_key(category_id, min_price, max_price, cursor_str):
+    """Build a cache key for one filter combination, namespaced by version"""
+    version = cache.get(SEARCH_CACHE_VER_KEY, 1)
+    return f'psearch:{version}:{category_id}:{min_price}:{max_price}:{cursor_str}'
+
+
+def _json(data, status=200):
+    """
+    Encode a response payload with orjson instead of stdlib json
+    orjson is a C extension and handles Decimal/datetime via default=str,
+    so it's significantly cheaper on dict-heavy payloads
+    """
+    return HttpResponse(
+        orjson.dumps(data, default=str),
+        status=status,
+        content_type='application/json'
+    )
+
 
 class ProductSearchView(View):
     """
@@ -23,106 +235,176 @@ class ProductSearchView(View):
             # Extract and validate parameters
             category_id = self._get_category_id(request)
             min_price, max_price = self._get_price_range(request)
+            cursor = self._get_cursor(request)
             
             # Validate price range makes sense
             if min_price is not None and max_price is not None:
                 if min_price > max_price:
-                    return JsonResponse({
+                    return _json({
                         'success': False,
                         'error': 'Minimum price cannot be greater than maximum price'
                     }, status=400)
             
-            # Build filters dictionary
-            filters = {
-                'category_id': category_id,
-                'min_price': min_price,
-                'max_price': max_price,
-            }
+            # Serve repeated identical searches straight from the cache -
+            # a single cache GET instead of a query plus serialization
+            cache_key = _search_cache_key(
+                category_id, min_price, max_price, request.GET.get('cursor')
+            )
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return HttpResponse(cached, content_type='application/json')
+
+            # Build filters dictionary with only the filters actually given
+            # (also fixes min_price-only requests being silently ignored)
+            filters = {}
+            if category_id:
+                filters['category_id'] = category_id
+            if min_price is not None or max_price is not None:
+                filters['price_range'] = (min_price, max_price)
             
+            # On PostgreSQL, let json_agg build the products array in the
+            # database - one cell back instead of one row per product
+            if connection.vendor == 'postgresql':
+                response_blob = _postgres_search_response(filters, cursor)
+                cache.set(cache_key, response_blob, SEARCH_CACHE_TTL)
+                return HttpResponse(response_blob, content_type='application/json')
+
             # Execute search using service layer
             products_queryset = ProductSearchService.search_products(filters)
-            
-            # Convert to JSON-serializable format
-            products_data = []
-            for product in products_queryset:
-                products_data.append({
-                    'id': product.id,
-                    'sku': product.sku,
-                    'name': product.name,
-                    'price': str(product.price),  # Convert Decimal to string for JSON
-                    'is_active': product.is_active,
-                    'category': {
-                        'id': product.category.id,
-                        'name': product.category.name
-                    },
-                    'created_at': product.created_at.isoformat(),
-                    'description': product.description,
-                })
-            
-            # Return successful response
-            return JsonResponse({
-                'success': True,
-                'products': products_data,
-                'count': len(products_data),
-                'filters_applied': filters
-            })
-            
+
+            # Keyset pagination: seek past the cursor position instead of
+            # walking OFFSET rows; id breaks created_at ties
+            if cursor is not None:
+                cursor_dt, cursor_id = cursor
+                products_queryset = products_queryset.filter(
+                    Q(created_at__lt=cursor_dt) |
+                    Q(created_at=cursor_dt, id__lt=cursor_id)
+                )
+            products_queryset = products_queryset.order_by(
+                '-created_at', '-id'
+            )[:SEARCH_PAGE_SIZE]
+
+            # Fetch plain dicts instead of Product instances - .values() skips
+            # model __init__ and descriptor overhead, and pulls the category
+            # name through the JOIN without materializing Category objects.
+            # description (TEXT, potentially kilobytes per row) is list-view
+            # dead weight - it stays detail-only, which also keeps the rows
+            # narrow enough for index-only scans on the covering index
+            values_queryset = products_queryset.values(
+                'id', 'sku', 'name', 'price', 'is_active',
+                'category_id', 'category__name', 'created_at',
+            )
+
+            # Open the cursor and fetch the first row here, inside the try
+            # block, so query-time database errors become an ordinary 500
+            # instead of escaping from the generator after the 200 status
+            # line and opening bytes have already been sent
+            row_iter = values_queryset.iterator(chunk_size=500)
+            first_row = next(row_iter, None)
+            rows = chain([first_row], row_iter) if first_row is not None else ()
+
+            # Stream the body row by row - .iterator() bypasses the queryset
+            # result cache, so peak memory is one DB chunk rather than the
+            # whole page, and the first byte leaves before the last row is
+            # read. Emitted chunks are collected so later identical requests
+            # can replay the same bytes from the cache
+            def stream():
+                parts = []
+
+                def emit(chunk):
+                    parts.append(chunk)
+                    return chunk
+
+                yield emit(b'{"success":true,"products":[')
+                count = 0
+                last_row = None
+                try:
+                    for r in rows:
+                        separator = b',' if count else b''
+                        count += 1
+                        last_row = r
+                        yield emit(separator + orjson.dumps({
+                            'id': r['id'],
+                            'sku': r['sku'],
+                            'name': r['name'],
+                            'price': _price_str(r['price']),
+                            'is_active': r['is_active'],
+                            'category': {
+                                'id': r['category_id'],
+                                'name': r['category__name']
+                            },
+                            'created_at': r['created_at'],
+                        }, default=str))
+                except DatabaseError:
+                    # Headers are already out, so a 500 is no longer
+                    # possible - close the body as valid JSON that flags
+                    # the truncation, and don't cache the partial page
+                    yield b'],"error":"Database error occurred","truncated":true}'
+                    return
+
+                # Hand the client a cursor for the next page when full
+                next_cursor = None
+                if count == SEARCH_PAGE_SIZE:
+                    next_cursor = _encode_cursor(
+                        last_row['created_at'], last_row['id']
+                    )
+                tail = orjson.dumps({
+                    'count': count,
+                    'next_cursor': next_cursor,
+                    'filters_applied': _filters_echo(filters)
+                }, default=str)
+                yield emit(b'],' + tail[1:])
+                cache.set(cache_key, b''.join(parts), SEARCH_CACHE_TTL)
+
+            return StreamingHttpResponse(
+                stream(), content_type='application/json'
+            )
+
         except ValueError as e:
             # Handle validation errors
-            return JsonResponse({
+            return _json({
                 'success': False,
                 'error': f'Invalid parameter: {str(e)}'
             }, status=400)
-        except DatabaseError as e:
-            # Handle database errors
-            return JsonResponse({
+        except DatabaseError:
+            # Handle database errors; anything else propagates to Django's
+            # default handler so exception middleware sees it
+            return _json({
                 'success': False,
                 'error': 'Database error occurred'
             }, status=500)
-        except Exception as e:
-            # Handle unexpected errors
-            return JsonResponse({
-                'success': False,
-                'error': f'Unexpected server error: {str(e)}'
-            }, status=500)
     
     def _get_category_id(self, request):
         """Extract and validate category_id from request parameters"""
         category_id = request.GET.get('category_id')
-        if category_id:
-            try:
-                return int(category_id)
-            except (ValueError, TypeError):
-                raise ValueError('category_id must be a valid number')
-        return None
+        if not category_id:
+            return None
+        # isdecimal() guard keeps malformed input off the exception
+        # machinery that a failed int() would otherwise pay for - unlike
+        # isdigit(), it admits exactly what int() accepts (no superscripts
+        # or other exotic digit characters)
+        if not category_id.isdecimal():
+            raise ValueError('category_id must be a valid number')
+        return int(category_id)
     
+    def _get_cursor(self, request):
+        """Extract and decode the pagination cursor if provided"""
+        cursor_str = request.GET.get('cursor')
+        if not cursor_str:
+            return None
+        return _decode_cursor(cursor_str)
+
     def _get_price_range(self, request):
-        """Extract and validate price range parameters"""
-        min_price_str = request.GET.get('min_price')
-        max_price_str = request.GET.get('max_price')
-        
-        min_price = None
-        max_price = None
-        
-        # Parse min_price if provided
-        if min_price_str:
-            try:
-                min_price = decimal.Decimal(min_price_str)
-                if min_price < 0:
-                    raise ValueError('Price cannot be negative')
-            except (ValueError, decimal.InvalidOperation):
-                raise ValueError('min_price must be a valid dollar amount')
-        
-        # Parse max_price if provided  
-        if max_price_str:
-            try:
-                max_price = decimal.Decimal(max_price_str)
-                if max_price < 0:
-                    raise ValueError('Price cannot be negative')
-            except (ValueError, decimal.InvalidOperation):
-                raise ValueError('max_price must be a valid dollar amount')
-        
-        return min_price, max_price
+        """
+        Extract and validate price range parameters
+        Dollar amounts from the query string are converted to integer
+        cents, matching how prices are stored - no Decimal allocation
+        and integer comparisons in the index range scan
+        """
+        return (
+            _parse_price(request.GET.get('min_price'), 'min_price'),
+            _parse_price(request.GET.get('max_price'), 'max_price'),
+        )
 
 
 class ProductDetailView(View):
@@ -137,48 +419,65 @@ class ProductDetailView(View):
         try:
             # Basic product_id validation
             if not isinstance(product_id, int) and not product_id.isdigit():
-                return JsonResponse({
+                return _json({
                     'success': False,
                     'error': 'Product ID must be a valid number'
                 }, status=400)
             
             product_id = int(product_id)
-            
-            # Get product with optimized query
+
+            # Lightweight freshness probe before fetching the whole row -
+            # clients holding a current copy get a body-less 304 for the
+            # cost of a single-column lookup
+            updated_at = Product.objects.filter(
+                id=product_id
+            ).values_list('updated_at', flat=True).first()
+            if updated_at is None:
+                return _json({
+                    'success': False,
+                    'error': 'Product not found'
+                }, status=404)
+
+            etag = f'W/"{product_id}-{int(updated_at.timestamp())}"'
+            if request.META.get('HTTP_IF_NONE_MATCH') == etag:
+                response = HttpResponseNotModified()
+                response['ETag'] = etag
+                return response
+
+            # Get product row as a plain dict - no model instantiation;
+            # None instead of a raised DoesNotExist on the miss path
             product = ProductSearchService.get_product_detail(product_id)
-            
+            if product is None:
+                return _json({
+                    'success': False,
+                    'error': 'Product not found'
+                }, status=404)
+
             # Build response data
             product_data = {
-                'id': product.id,
-                'sku': product.sku,
-                'name': product.name,
-                'price': str(product.price),
-                'is_active': product.is_active,
+                'id': product['id'],
+                'sku': product['sku'],
+                'name': product['name'],
+                'price': _price_str(product['price']),
+                'is_active': product['is_active'],
                 'category': {
-                    'id': product.category.id,
-                    'name': product.category.name
+                    'id': product['category__id'],
+                    'name': product['category__name']
                 },
-                'description': product.description,
-                'created_at': product.created_at.isoformat(),
+                'description': product['description'],
+                'created_at': product['created_at'],
             }
             
-            return JsonResponse({
+            response = _json({
                 'success': True,
                 'product': product_data
             })
-            
-        except ObjectDoesNotExist:
-            return JsonResponse({
-                'success': False,
-                'error': 'Product not found'
-            }, status=404)
+            response['ETag'] = etag
+            return response
+
         except DatabaseError:
-            return JsonResponse({
+            # Anything unexpected propagates to Django's default handler
+            return _json({
                 'success': False,
                 'error': 'Database error occurred'
-            }, status=500)
-        except Exception as e:
-            return JsonResponse({
-                'success': False,
-                'error': f'Unexpected error: {str(e)}'
             }, status=500)
\ No newline at end of file